@@ -0,0 +1,44 @@
+# cython: language_level=3, boundscheck=False, cdivision=True
+"""
+AgentPay Protocol - AOT-compiled fee calculation
+
+Build with: python setup_fast.py build_ext --inplace
+"""
+
+
+cpdef double calc_fee(
+    double amount,
+    int complexity,
+    int reputation,
+    bint is_cross_chain
+) noexcept nogil:
+    """Calculate the fee for a single escrow (same rules as _calc_fee_impl)"""
+    cdef double mul = 0.75 if complexity == 0 else (1.5 if complexity == 2 else 1.0)
+    cdef double fee = amount * 0.01 * mul
+    cdef double min_fee = amount * 0.005
+    cdef double max_fee = amount * 0.03
+
+    # Volume discount
+    if amount >= 50000:
+        fee *= 0.7
+    elif amount >= 10000:
+        fee *= 0.8
+    elif amount >= 1000:
+        fee *= 0.9
+
+    # Reputation discount
+    if reputation >= 800:
+        fee *= 0.9
+    elif reputation >= 500:
+        fee *= 0.95
+
+    # Cross-chain fee
+    if is_cross_chain:
+        fee += amount * 0.005
+
+    # Ensure within bounds (0.5% - 3%)
+    if fee > max_fee:
+        fee = max_fee
+    if fee < min_fee:
+        fee = min_fee
+    return fee
@@ -10,22 +10,250 @@ This SDK allows autonomous agents to:
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
+import logging
+import os
+import secrets
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-from web3 import Web3
+from functools import lru_cache
+import aiohttp
+import numpy as np
+import orjson
+from web3 import AsyncWeb3, AsyncHTTPProvider, Web3
 from eth_account import Account
 import time
+from time import time_ns as _time_ns
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    njit = None
 
 # Import our bridge skill
 import sys
 sys.path.append('./skill')
 from bridge_skill import MultiChainBridgeSkill, Chain
 
+log = logging.getLogger("agentpay")
+
+
+# ============ Contract ABI ============
+
+_ESCROW_ABI = (
+    {
+        "name": "createEscrow",
+        "type": "function",
+        "inputs": [
+            {"name": "_worker", "type": "address"},
+            {"name": "_amount", "type": "uint256"},
+            {"name": "_fee", "type": "uint256"},
+            {"name": "_taskDescription", "type": "string"},
+            {"name": "_criteria", "type": "string"},
+            {"name": "_deadline", "type": "uint256"}
+        ],
+        "outputs": [{"name": "", "type": "uint256"}]
+    },
+    {
+        "name": "submitWork",
+        "type": "function",
+        "inputs": [
+            {"name": "_escrowId", "type": "uint256"},
+            {"name": "_workHash", "type": "bytes32"},
+            {"name": "_workUrl", "type": "string"}
+        ]
+    },
+    {
+        "name": "getEscrow",
+        "type": "function",
+        "inputs": [{"name": "_escrowId", "type": "uint256"}],
+        "outputs": [{
+            "name": "",
+            "type": "tuple",
+            "components": [
+                {"name": "id", "type": "uint256"},
+                {"name": "employer", "type": "address"},
+                {"name": "worker", "type": "address"},
+                {"name": "amount", "type": "uint256"},
+                {"name": "fee", "type": "uint256"},
+                {"name": "taskDescription", "type": "string"},
+                {"name": "verificationCriteria", "type": "string"},
+                {"name": "workHash", "type": "bytes32"},
+                {"name": "workUrl", "type": "string"},
+                {"name": "state", "type": "uint8"},
+                {"name": "createdAt", "type": "uint256"},
+                {"name": "deadline", "type": "uint256"},
+                {"name": "submittedAt", "type": "uint256"},
+                {"name": "aiVerified", "type": "bool"},
+                {"name": "verificationReason", "type": "string"},
+                {"name": "verificationScore", "type": "uint256"}
+            ]
+        }]
+    }
+)
+
+# Address-less contract factory: the ABI is parsed and validated once, at import
+_ESCROW_CONTRACT_FACTORY = Web3().eth.contract(abi=_ESCROW_ABI)
+
+# AgentEscrow.EscrowState index -> (status, current_state)
+ESCROW_STATES = (
+    ("created", "awaiting_work"),
+    ("work_submitted", "awaiting_verification"),
+    ("verified", "awaiting_release"),
+    ("disputed", "in_dispute"),
+    ("released", "complete"),
+    ("refunded", "complete"),
+    ("cancelled", "complete"),
+)
+
+# Bound once at import so hot paths skip the module attribute lookup
+_sha256 = hashlib.sha256
+
+# Escrow IDs: pid and random bits disperse processes, the counter keeps IDs unique within one
+_escrow_id_counter = itertools.count(_time_ns() // 1_000_000_000)
+_ESCROW_ID_PREFIX = ((os.getpid() & 0xFFFF) << 48) | (secrets.randbits(16) << 32)
+
+
+# ============ Fee Calculation ============
+
+# Complexity multipliers indexed by complexity (0=low, 1=medium, 2=high)
+_CPLX_MUL = np.array([0.75, 1.0, 1.5])
+
+
+def calculate_fee_batch(
+    amounts,
+    complexities,
+    reputations,
+    is_cross_chain
+) -> np.ndarray:
+    """
+    Vectorized fee calculation for many escrows at once
+    
+    Args:
+        amounts: Amounts in USDC
+        complexities: Task complexities (0=low, 1=medium, 2=high)
+        reputations: Worker reputation scores (0-1000)
+        is_cross_chain: Whether each escrow needs a bridge
+        
+    Returns:
+        Array of fees in USDC
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    complexities = np.asarray(complexities, dtype=np.int64)
+    reputations = np.asarray(reputations)
+    is_cross_chain = np.asarray(is_cross_chain, dtype=bool)
+    
+    # Base fee: 1%
+    fee = amounts * 0.01
+    
+    # Complexity multiplier (unknown complexities count as medium)
+    known = (complexities >= 0) & (complexities < len(_CPLX_MUL))
+    fee *= np.where(known, _CPLX_MUL[np.clip(complexities, 0, len(_CPLX_MUL) - 1)], 1.0)
+    
+    # Volume discount
+    fee *= np.select(
+        [amounts >= 50000, amounts >= 10000, amounts >= 1000],
+        [0.7, 0.8, 0.9],
+        default=1.0
+    )
+    
+    # Reputation discount
+    fee *= np.select(
+        [reputations >= 800, reputations >= 500],
+        [0.9, 0.95],
+        default=1.0
+    )
+    
+    # Cross-chain fee
+    fee += amounts * 0.005 * is_cross_chain.astype(float)
+    
+    # Ensure within bounds (0.5% - 3%)
+    return np.clip(fee, amounts * 0.005, amounts * 0.03)
+
+
+def _calc_fee_impl(
+    amount: float,
+    complexity: int,
+    reputation: int,
+    is_cross_chain: bool
+) -> float:
+    """Scalar fee calculation for a single escrow (compiled when _fast or numba is available)"""
+    # Base fee: 1%, scaled by complexity
+    mul = 0.75 if complexity == 0 else (1.5 if complexity == 2 else 1.0)
+    fee = amount * 0.01 * mul
+    
+    # Volume discount
+    if amount >= 50000:
+        fee *= 0.7
+    elif amount >= 10000:
+        fee *= 0.8
+    elif amount >= 1000:
+        fee *= 0.9
+    
+    # Reputation discount
+    if reputation >= 800:
+        fee *= 0.9
+    elif reputation >= 500:
+        fee *= 0.95
+    
+    # Cross-chain fee
+    if is_cross_chain:
+        fee += amount * 0.005
+    
+    # Ensure within bounds (0.5% - 3%)
+    return max(amount * 0.005, min(fee, amount * 0.03))
+
+
+try:
+    # AOT-compiled build of the same function (see setup_fast.py): no JIT warm-up
+    from _fast import calc_fee as _calc_fee_impl
+except ImportError:
+    if njit is not None:
+        # Explicit signature compiles at import; cache=True reuses the machine code across runs
+        _calc_fee_impl = njit(
+            "float64(float64, int64, int64, boolean)",
+            cache=True,
+            fastmath=True
+        )(_calc_fee_impl)
+
+
+# ============ Read Caches ============
+
+REPUTATION_TTL = 60  # seconds
+ESCROW_STATUS_TTL = 3  # seconds, for escrows that can still change state
+TERMINAL_STATUSES = frozenset({"released", "refunded", "cancelled"})
+MAX_CACHE_ENTRIES = 10_000
+
+# key -> (value, expires_at); expires_at of None means the entry never expires
+_reputation_cache: Dict[tuple, tuple] = {}
+_escrow_status_cache: Dict[tuple, tuple] = {}
+
 
-@dataclass
+def _cache_get(cache: Dict, key):
+    """Return a cached value, or None if missing or expired"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    value, expires_at = entry
+    if expires_at is not None and expires_at <= time.monotonic():
+        del cache[key]
+        return None
+    return value
+
+
+def _cache_put(cache: Dict, key, value, ttl: Optional[float]):
+    """Store a value, evicting the oldest entries (FIFO) once the cache is full"""
+    cache.pop(key, None)
+    while len(cache) >= MAX_CACHE_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = (value, None if ttl is None else time.monotonic() + ttl)
+
+
+@dataclass(slots=True, frozen=True)
 class EscrowDetails:
-    """Details of an escrow"""
+    """Details of an escrow (immutable; use dataclasses.replace() to update)"""
     escrow_id: int
     employer: str
     worker: str
@@ -35,7 +263,7 @@ class EscrowDetails:
     criteria: str
     state: str
     deadline: int
-    work_hash: Optional[str] = None
+    work_hash: Optional[bytes] = None
     work_url: Optional[str] = None
     verification_score: Optional[int] = None
 
@@ -45,6 +273,11 @@ class AgentPayClient:
     Main client for interacting with AgentPay Protocol
     """
     
+    # One aiohttp session and AsyncWeb3 per chain, shared by every client instance
+    _session_pool: Dict[Chain, aiohttp.ClientSession] = {}
+    _session_loops: Dict[Chain, asyncio.AbstractEventLoop] = {}
+    _web3_pool: Dict[Chain, AsyncWeb3] = {}
+    
     def __init__(
         self,
         wallet_address: str,
@@ -65,10 +298,10 @@ class AgentPayClient:
         """
         self.wallet_address = wallet_address
         self.private_key = private_key
-        self.current_chain = chain
         
         # Initialize bridge skill
         self.bridge_skill = MultiChainBridgeSkill()
+        self._set_chain(chain)
         
         # Contract addresses (use provided or defaults)
         self.escrow_address = escrow_contract_address
@@ -80,50 +313,88 @@ class AgentPayClient:
         # Load contract ABIs
         self._load_contracts()
     
+    def _set_chain(self, chain: Chain):
+        """Set the current chain and cache its lookups"""
+        self.current_chain = chain
+        self._chain_value = chain.value
+        self._chain_config = self.bridge_skill.chains[chain]
+    
+    def switch_chain(self, chain: Chain):
+        """
+        Switch the client to another chain
+        
+        Args:
+            chain: Chain to operate on from now on
+        """
+        self._set_chain(chain)
+        self._init_web3()
+        self._load_contracts()
+    
     def _init_web3(self):
-        """Initialize Web3 connection for current chain"""
-        chain_config = self.bridge_skill.chains[self.current_chain]
-        self.w3 = Web3(Web3.HTTPProvider(chain_config.rpc_url))
+        """Initialize async Web3 connection for current chain"""
+        w3 = self._web3_pool.get(self.current_chain)
+        if w3 is None:
+            w3 = AsyncWeb3(AsyncHTTPProvider(
+                self._chain_config.rpc_url,
+                request_kwargs={"timeout": aiohttp.ClientTimeout(total=10)}
+            ))
+            self._web3_pool[self.current_chain] = w3
+        self.w3 = w3
         self.account = Account.from_key(self.private_key)
     
+    async def _connect(self):
+        """
+        Attach the shared aiohttp session for the current chain to the provider
+        
+        Sessions must be created inside a running event loop, so this is done
+        lazily on the first RPC instead of in __init__.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._session_pool.get(self.current_chain)
+        
+        # A session opened under an earlier asyncio.run() is bound to a dead loop
+        if session is not None and self._session_loops.get(self.current_chain) is not loop:
+            try:
+                await session.close()
+            except RuntimeError as exc:
+                log.debug("Could not close stale session for %s: %s", self._chain_value, exc)
+            session = None
+        
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=100,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            ))
+            self._session_pool[self.current_chain] = session
+            self._session_loops[self.current_chain] = loop
+        await self.w3.provider.cache_async_session(session)
+    
+    @classmethod
+    async def aclose_all(cls):
+        """Close every pooled HTTP session (call once on shutdown)"""
+        sessions = list(cls._session_pool.values())
+        cls._session_pool.clear()
+        cls._session_loops.clear()
+        cls._web3_pool.clear()
+        # The contract cache pins the Web3 instances it was built from
+        cls._get_contract.cache_clear()
+        await asyncio.gather(*(session.close() for session in sessions))
+    
     def _load_contracts(self):
         """Load contract ABIs and instances"""
-        self.escrow_abi = [
-            {
-                "name": "createEscrow",
-                "type": "function",
-                "inputs": [
-                    {"name": "_worker", "type": "address"},
-                    {"name": "_amount", "type": "uint256"},
-                    {"name": "_fee", "type": "uint256"},
-                    {"name": "_taskDescription", "type": "string"},
-                    {"name": "_criteria", "type": "string"},
-                    {"name": "_deadline", "type": "uint256"}
-                ],
-                "outputs": [{"name": "", "type": "uint256"}]
-            },
-            {
-                "name": "submitWork",
-                "type": "function",
-                "inputs": [
-                    {"name": "_escrowId", "type": "uint256"},
-                    {"name": "_workHash", "type": "bytes32"},
-                    {"name": "_workUrl", "type": "string"}
-                ]
-            },
-            {
-                "name": "getEscrow",
-                "type": "function",
-                "inputs": [{"name": "_escrowId", "type": "uint256"}],
-                "outputs": [{"name": "", "type": "tuple"}]
-            }
-        ]
-        
+        self.escrow_abi = _ESCROW_ABI
+        self.escrow_contract = None
+        self._get_escrow_fn = None
         if self.escrow_address:
-            self.escrow_contract = self.w3.eth.contract(
-                address=self.escrow_address,
-                abi=self.escrow_abi
-            )
+            self.escrow_contract = self._get_contract(self.w3, self.escrow_address)
+            self._get_escrow_fn = self.escrow_contract.functions.getEscrow
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _get_contract(cls, w3: AsyncWeb3, address: str):
+        """Build (once per Web3 instance and address) an AgentEscrow contract object"""
+        return w3.eth.contract(address=address, abi=_ESCROW_CONTRACT_FACTORY.abi)
     
     async def create_escrow(
         self,
@@ -150,16 +421,32 @@ class AgentPayClient:
         Returns:
             Dict with escrow info and transaction details
         """
-        print(f"\n🔨 Creating escrow...")
-        print(f"   Employer: {self.wallet_address} on {self.current_chain.value}")
-        print(f"   Worker: {worker_address}")
-        print(f"   Amount: {amount} USDC")
+        log.info("🔨 Creating escrow...")
+        log.info("   Employer: %s on %s", self.wallet_address, self._chain_value)
+        log.info("   Worker: %s", worker_address)
+        log.info("   Amount: %s USDC", amount)
         
         # Check if cross-chain bridge needed
         is_cross_chain = worker_chain and worker_chain != self.current_chain
         
+        # Reputation lookup and bridge routing are independent: run them concurrently
+        reputation_task = asyncio.create_task(self._get_worker_reputation(worker_address))
+        bridge_task = None
+        if is_cross_chain:
+            bridge_task = asyncio.create_task(self._prepare_bridge(
+                self.current_chain,
+                worker_chain,
+                amount
+            ))
+        
         # Calculate fee
-        worker_reputation = await self._get_worker_reputation(worker_address)
+        try:
+            worker_reputation = await reputation_task
+        except BaseException:
+            # Don't leave the bridge preparation running unobserved
+            if bridge_task is not None:
+                bridge_task.cancel()
+            raise
         fee = self._calculate_fee(
             amount,
             complexity,
@@ -167,19 +454,26 @@ class AgentPayClient:
             is_cross_chain
         )
         
-        print(f"   Fee: {fee:.4f} USDC ({(fee/amount*100):.2f}%)")
-        print(f"   Total: {amount + fee:.4f} USDC")
-        
-        # Prepare criteria JSON
-        criteria_json = json.dumps(criteria)
+        log.info("   Fee: %.4f USDC (%.2f%%)", fee, fee / amount * 100)
+        log.info("   Total: %.4f USDC", amount + fee)
         
         # Calculate deadline timestamp
-        deadline = int(time.time()) + (deadline_hours * 3600)
+        now_s = _time_ns() // 1_000_000_000
+        deadline = now_s + deadline_hours * 3600
         
         # Convert amounts to contract format (6 decimals for USDC)
         amount_wei = int(amount * 1e6)
         fee_wei = int(fee * 1e6)
         
+        # In production: call smart contract
+        # For demo: simulate
+        escrow_id = self._generate_escrow_id()
+        
+        bridge_info = None
+        if is_cross_chain:
+            log.info("🌉 Setting up cross-chain bridge...")
+            bridge_info = await bridge_task
+        
         # Create escrow details
         escrow_details = {
             "employer": self.wallet_address,
@@ -191,30 +485,18 @@ class AgentPayClient:
             "deadline": deadline,
             "deadline_hours": deadline_hours,
             "is_cross_chain": is_cross_chain,
-            "employer_chain": self.current_chain.value,
-            "worker_chain": worker_chain.value if worker_chain else self.current_chain.value,
+            "employer_chain": self._chain_value,
+            "worker_chain": worker_chain.value if worker_chain else self._chain_value,
             "complexity": complexity,
             "worker_reputation": worker_reputation,
-            "timestamp": int(time.time())
+            "timestamp": now_s,
+            "escrow_id": escrow_id,
+            "status": "created",
+            "tx_hash": f"0x{'0'*64}",  # Mock tx hash
+            "bridge_info": bridge_info
         }
         
-        # In production: call smart contract
-        # For demo: simulate
-        escrow_id = self._generate_escrow_id()
-        escrow_details["escrow_id"] = escrow_id
-        escrow_details["status"] = "created"
-        escrow_details["tx_hash"] = f"0x{'0'*64}"  # Mock tx hash
-        
-        print(f"✅ Escrow created! ID: {escrow_id}")
-        
-        if is_cross_chain:
-            print(f"\n🌉 Setting up cross-chain bridge...")
-            bridge_info = await self._prepare_bridge(
-                self.current_chain,
-                worker_chain,
-                amount
-            )
-            escrow_details["bridge_info"] = bridge_info
+        log.info("✅ Escrow created! ID: %s", escrow_id)
         
         return escrow_details
     
@@ -226,45 +508,25 @@ class AgentPayClient:
         is_cross_chain: bool
     ) -> float:
         """Calculate dynamic fee"""
-        # Base fee: 1%
-        fee = amount * 0.01
-        
-        # Complexity multiplier
-        complexity_multipliers = {0: 0.75, 1: 1.0, 2: 1.5}
-        fee *= complexity_multipliers.get(complexity, 1.0)
-        
-        # Volume discount
-        if amount >= 50000:
-            fee *= 0.7  # 30% discount
-        elif amount >= 10000:
-            fee *= 0.8  # 20% discount
-        elif amount >= 1000:
-            fee *= 0.9  # 10% discount
-        
-        # Reputation discount
-        if worker_reputation >= 800:
-            fee *= 0.9  # 10% off
-        elif worker_reputation >= 500:
-            fee *= 0.95  # 5% off
-        
-        # Cross-chain fee
-        if is_cross_chain:
-            fee += amount * 0.005  # +0.5%
-        
-        # Ensure within bounds (0.5% - 3%)
-        min_fee = amount * 0.005
-        max_fee = amount * 0.03
-        fee = max(min_fee, min(fee, max_fee))
-        
-        return fee
+        return _calc_fee_impl(
+            float(amount),
+            int(complexity),
+            int(worker_reputation),
+            bool(is_cross_chain)
+        )
     
     async def _get_worker_reputation(self, worker_address: str) -> int:
         """Get worker reputation score (0-1000)"""
-        return 750
+        key = (self.current_chain, self.escrow_address, worker_address.lower())
+        reputation = _cache_get(_reputation_cache, key)
+        if reputation is None:
+            reputation = 750
+            _cache_put(_reputation_cache, key, reputation, REPUTATION_TTL)
+        return reputation
     
     def _generate_escrow_id(self) -> int:
-        """Generate escrow ID"""
-        return int(time.time() * 1000) % 1000000
+        """Generate escrow ID (unique for 2^32 IDs per process)"""
+        return (_ESCROW_ID_PREFIX | (next(_escrow_id_counter) & 0xFFFFFFFF)) & ((1 << 63) - 1)
     
     async def _prepare_bridge(
         self,
@@ -301,33 +563,37 @@ class AgentPayClient:
         Returns:
             Dict with submission details
         """
-        print(f"\n📤 Submitting work for escrow #{escrow_id}...")
+        log.info("📤 Submitting work for escrow #%s...", escrow_id)
         
         # Generate work hash
         work_hash = self._generate_work_hash(work_url, work_data)
         
-        print(f"   Work URL: {work_url}")
-        print(f"   Work Hash: {work_hash}")
+        log.info("   Work URL: %s", work_url)
+        log.info("   Work Hash: 0x%s", work_hash.hex())
         
         result = {
             "escrow_id": escrow_id,
             "work_url": work_url,
             "work_hash": work_hash,
             "submitted_by": self.wallet_address,
-            "timestamp": int(time.time()),
+            "timestamp": _time_ns() // 1_000_000_000,
             "status": "submitted",
             "tx_hash": f"0x{'1'*64}"
         }
         
-        print(f"✅ Work submitted! Waiting for AI verification...")
+        log.info("✅ Work submitted! Waiting for AI verification...")
         
         return result
     
-    def _generate_work_hash(self, work_url: str, work_data: Optional[Dict]) -> str:
-        """Generate hash of work for verification"""
-        import hashlib
-        data = f"{work_url}-{json.dumps(work_data) if work_data else ''}"
-        return "0x" + hashlib.sha256(data.encode()).hexdigest()
+    def _generate_work_hash(self, work_url: str, work_data: Optional[Dict]) -> bytes:
+        """Generate hash of work for verification (raw bytes32, as submitWork expects)"""
+        # Feed the hash incrementally; orjson emits bytes, so no str round-trip
+        h = _sha256()
+        h.update(work_url.encode())
+        h.update(b"-")
+        if work_data:
+            h.update(orjson.dumps(work_data, option=orjson.OPT_NON_STR_KEYS))
+        return h.digest()
     
     async def verify_work_with_ai(
         self,
@@ -346,7 +612,7 @@ class AgentPayClient:
         Returns:
             Dict with verification result
         """
-        print(f"\n🤖 AI Verifying work for escrow #{escrow_id}...")
+        log.info("🤖 AI Verifying work for escrow #%s...", escrow_id)
         
         await asyncio.sleep(2)
         
@@ -359,18 +625,18 @@ class AgentPayClient:
             "passed": passed,
             "score": score,
             "reason": reason,
-            "timestamp": int(time.time()),
+            "timestamp": _time_ns() // 1_000_000_000,
             "verified_by": "AI Agent (Claude)"
         }
         
         if passed:
-            print(f"✅ Verification PASSED!")
-            print(f"   Score: {score}/100")
-            print(f"   Reason: {reason}")
+            log.info("✅ Verification PASSED!")
+            log.info("   Score: %s/100", score)
+            log.info("   Reason: %s", reason)
         else:
-            print(f"❌ Verification FAILED!")
-            print(f"   Score: {score}/100")
-            print(f"   Reason: {reason}")
+            log.warning("❌ Verification FAILED!")
+            log.warning("   Score: %s/100", score)
+            log.warning("   Reason: %s", reason)
         
         return result
     
@@ -384,11 +650,73 @@ class AgentPayClient:
         Returns:
             Dict with escrow status
         """
+        statuses = await self.check_escrow_status_many([escrow_id])
+        return statuses[0]
+    
+    async def check_escrow_status_many(self, escrow_ids: List[int]) -> List[Dict]:
+        """
+        Check status of several escrows with a single JSON-RPC batch request
+        
+        Args:
+            escrow_ids: Escrow IDs
+            
+        Returns:
+            List of escrow status dicts, in the same order as escrow_ids
+        """
+        if not escrow_ids:
+            return []
+        
+        # No deployed contract configured: simulate
+        if self.escrow_contract is None:
+            return [
+                {
+                    "escrow_id": escrow_id,
+                    "status": "created",
+                    "current_state": "awaiting_work",
+                    "time_remaining_hours": 24
+                }
+                for escrow_id in escrow_ids
+            ]
+        
+        # Same deployer + nonce gives the same address on every testnet, so key by chain too
+        cache_prefix = (self.current_chain, self.escrow_address)
+        statuses = {}
+        missing = []
+        for escrow_id in escrow_ids:
+            cached = _cache_get(_escrow_status_cache, (*cache_prefix, escrow_id))
+            if cached is None:
+                missing.append(escrow_id)
+            else:
+                statuses[escrow_id] = cached
+        
+        if missing:
+            await self._connect()
+            get_escrow = self._get_escrow_fn
+            async with self.w3.batch_requests() as batch:
+                for escrow_id in missing:
+                    batch.add(get_escrow(escrow_id))
+                results = await batch.async_execute()
+            
+            for escrow_id, escrow in zip(missing, results):
+                status = self._format_escrow_status(escrow_id, escrow)
+                # Terminal states can never change again, so cache them for good
+                ttl = None if status["status"] in TERMINAL_STATUSES else ESCROW_STATUS_TTL
+                _cache_put(_escrow_status_cache, (*cache_prefix, escrow_id), status, ttl)
+                statuses[escrow_id] = status
+        
+        # Hand out copies so callers cannot mutate the cached dicts
+        return [dict(statuses[escrow_id]) for escrow_id in escrow_ids]
+    
+    def _format_escrow_status(self, escrow_id: int, escrow: tuple) -> Dict:
+        """Convert a decoded getEscrow() struct into a status dict"""
+        status, current_state = ESCROW_STATES[escrow[9]]
+        deadline = escrow[11]
+        
         return {
             "escrow_id": escrow_id,
-            "status": "created",
-            "current_state": "awaiting_work",
-            "time_remaining_hours": 24
+            "status": status,
+            "current_state": current_state,
+            "time_remaining_hours": max(0, deadline - _time_ns() // 1_000_000_000) // 3600
         }
     
     async def execute_full_flow(
@@ -420,9 +748,7 @@ class AgentPayClient:
         Returns:
             Dict with complete flow results
         """
-        print("\n" + "="*60)
-        print("🚀 EXECUTING FULL AGENTPAY FLOW")
-        print("="*60)
+        log.info("🚀 EXECUTING FULL AGENTPAY FLOW")
         
         flow_results = {}
         
@@ -437,7 +763,6 @@ class AgentPayClient:
         flow_results["escrow"] = escrow
         
         # Step 2: Submit work
-        await asyncio.sleep(1)
         submission = await self.submit_work(
             escrow["escrow_id"],
             work_url
@@ -445,7 +770,6 @@ class AgentPayClient:
         flow_results["submission"] = submission
         
         # Step 3: AI Verification
-        await asyncio.sleep(1)
         verification = await self.verify_work_with_ai(
             escrow["escrow_id"],
             criteria,
@@ -455,52 +779,78 @@ class AgentPayClient:
         
         # Step 4: Release payment (if verified)
         if verification["passed"]:
-            await asyncio.sleep(1)
-            print(f"\n💰 Releasing payment...")
-            print(f"   Worker receives: {amount} USDC")
-            print(f"   Protocol fee: {escrow['fee']:.4f} USDC")
-            print(f"✅ Payment released!")
+            log.info("💰 Releasing payment...")
+            log.info("   Worker receives: %s USDC", amount)
+            log.info("   Protocol fee: %.4f USDC", escrow["fee"])
+            log.info("✅ Payment released!")
             
             flow_results["payment"] = {
                 "worker_payment": amount,
                 "protocol_fee": escrow["fee"],
                 "status": "released",
-                "timestamp": int(time.time())
+                "timestamp": _time_ns() // 1_000_000_000
             }
         
-        print("\n" + "="*60)
-        print("✅ FLOW COMPLETE!")
-        print("="*60)
-        
-        # Summary
-        print(f"\n📊 Summary:")
-        print(f"   Escrow ID: {escrow['escrow_id']}")
-        print(f"   Amount: {amount} USDC")
-        print(f"   Fee: {escrow['fee']:.4f} USDC ({(escrow['fee']/amount*100):.2f}%)")
-        print(f"   Verification: {'PASSED' if verification['passed'] else 'FAILED'}")
-        print(f"   Status: {'COMPLETE' if verification['passed'] else 'FAILED'}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("✅ FLOW COMPLETE!")
+            
+            # Summary
+            log.info("📊 Summary:")
+            log.info("   Escrow ID: %s", escrow["escrow_id"])
+            log.info("   Amount: %s USDC", amount)
+            log.info("   Fee: %.4f USDC (%.2f%%)", escrow["fee"], escrow["fee"] / amount * 100)
+            log.info("   Verification: %s", "PASSED" if verification["passed"] else "FAILED")
+            log.info("   Status: %s", "COMPLETE" if verification["passed"] else "FAILED")
         
         return flow_results
 
 
 # ============ Demo / Testing ============
 
-async def demo():
+def _json_default(value):
+    """Render non-JSON values in demo output (hashes as 0x-prefixed hex)"""
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    return str(value)
+
+
+DEMO_EMPLOYER_KEY = "0x" + "1" * 64
+DEMO_EMPLOYER_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+DEMO_WORKER_ADDRESS = "0x123d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+
+def make_demo_client() -> AgentPayClient:
+    """Create the client used by the demo"""
+    return AgentPayClient(
+        wallet_address=DEMO_EMPLOYER_ADDRESS,
+        private_key=DEMO_EMPLOYER_KEY,
+        chain=Chain.ARBITRUM_SEPOLIA
+    )
+
+
+async def warm(client: AgentPayClient):
+    """
+    Pay one-time costs up front so repeated demo runs measure steady state
+    
+    Triggers the fee JIT compile (a no-op once numba's cache is populated)
+    and attaches the pooled HTTP session for the client's chain.
+    """
+    client._calculate_fee(100.0, 1, 750, False)
+    await client._connect()
+
+
+async def run_demo(client: Optional[AgentPayClient] = None):
     """
     Run a complete demo of the AgentPay Protocol
+    
+    Args:
+        client: Client to reuse across runs (a new one is created if omitted)
     """
     print("🦞 AGENTPAY PROTOCOL - COMPLETE DEMO")
     print("="*60)
     
-    employer_key = "0x" + "1" * 64
-    employer_address = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
-    worker_address = "0x123d35Cc6634C0532925a3b844Bc454e4438f44e"
-    
-    client = AgentPayClient(
-        wallet_address=employer_address,
-        private_key=employer_key,
-        chain=Chain.ARBITRUM_SEPOLIA
-    )
+    if client is None:
+        client = make_demo_client()
     
     # Demo scenario: Data cleaning task
     task = "Clean and validate 5000 email records"
@@ -519,7 +869,7 @@ async def demo():
     
     # Execute full flow
     results = await client.execute_full_flow(
-        worker_address=worker_address,
+        worker_address=DEMO_WORKER_ADDRESS,
         amount=100.0,
         task_description=task,
         criteria=criteria,
@@ -529,8 +879,22 @@ async def demo():
     
     # Show results
     print("\n📄 Complete Results:")
-    print(json.dumps(results, indent=2, default=str))
+    print(json.dumps(results, indent=2, default=_json_default))
+
+
+# Original name of the demo coroutine, kept for existing imports
+demo = run_demo
 
 
 if __name__ == "__main__":
-    asyncio.run(demo())
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
+    # One loop for warm-up and the demo, so the session attached while warming stays usable
+    loop = asyncio.new_event_loop()
+    try:
+        demo_client = make_demo_client()
+        loop.run_until_complete(warm(demo_client))
+        loop.run_until_complete(run_demo(demo_client))
+    finally:
+        loop.run_until_complete(AgentPayClient.aclose_all())
+        loop.close()
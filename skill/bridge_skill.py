@@ -12,10 +12,37 @@ Features:
 
 import asyncio
 import json
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import hashlib
+from functools import lru_cache
+from itertools import islice, permutations
+from operator import itemgetter
+import secrets
+
+import aiohttp
+from cachetools import TTLCache
+
+
+# ERC-20 balanceOf(address) function selector
+BALANCE_OF_SELECTOR = "0x70a08231"
+USDC_DECIMALS = 6
+NATIVE_DECIMALS = 18
+MAX_BRIDGE_HISTORY = 10_000
+
+# HTTP statuses with which providers reject a JSON-RPC batch itself (not the request rate)
+_BATCH_REJECTED_STATUSES = frozenset({400, 405, 413, 415})
+
+# Bridge fee as a fraction of the bridged amount (0.1%)
+BRIDGE_FEE_RATE = 0.001
+
+# Escrow fee reputation discounts: (minimum reputation, fee multiplier), highest tier first
+_REP_TIERS = (
+    (800, 0.9),  # 10% off
+    (500, 0.95),  # 5% off
+    (0, 1.0),
+)
 
 
 class Chain(Enum):
@@ -26,8 +53,30 @@ class Chain(Enum):
     POLYGON_AMOY = "polygon-amoy"
 
 
-@dataclass
-class ChainConfig:
+# Precomputed so hot paths skip Enum iteration and the .value descriptor
+ALL_CHAINS: Tuple[Chain, ...] = tuple(Chain)
+CHAIN_VALUES: Dict[Chain, str] = {chain: chain.value for chain in ALL_CHAINS}
+
+
+def _hex_to_int(value: str) -> int:
+    """Decode a JSON-RPC hex quantity ("0x" counts as zero)"""
+    return int(value, 16) if value not in ("0x", None) else 0
+
+
+def _address_hex(address: str) -> str:
+    """
+    Return the 40 lowercase hex digits of an address, with or without its "0x" prefix
+    
+    Raises:
+        ValueError: If the address is not 20 bytes of hex
+    """
+    digits = address[2:] if address[:2] in ("0x", "0X") else address
+    if len(digits) != 40 or not all(c in "0123456789abcdefABCDEF" for c in digits):
+        raise ValueError(f"Invalid address: {address!r}")
+    return digits.lower()
+
+
+class ChainConfig(NamedTuple):
     """Configuration for each blockchain"""
     name: str
     chain_id: int
@@ -40,7 +89,7 @@ class ChainConfig:
     native_token: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BridgeRoute:
     """Represents a bridge route between chains"""
     from_chain: Chain
@@ -52,9 +101,79 @@ class BridgeRoute:
     reliability_score: float  # 0-1
 
 
-@dataclass
+# Same-chain "routes" cost nothing; prebuilt so that case allocates nothing
+_SAME_CHAIN_ROUTES: Dict[Chain, BridgeRoute] = {
+    chain: BridgeRoute(
+        from_chain=chain,
+        to_chain=chain,
+        estimated_time_seconds=0,
+        estimated_gas_cost_usd=0.0,
+        bridge_fee_usd=0.0,
+        total_cost_usd=0.0,
+        reliability_score=1.0
+    )
+    for chain in ALL_CHAINS
+}
+
+
+def _build_route_table() -> Dict[Tuple[Chain, Chain], Tuple[float, int, float]]:
+    """Precompute (gas cost USD, time seconds, reliability) for every cross-chain pair"""
+    table = {}
+    for from_chain, to_chain in permutations(ALL_CHAINS, 2):
+        base_gas_cost = 0.50  # ~$0.50 in ETH for transaction
+        
+        # Estimate time based on chains
+        if Chain.BASE_SEPOLIA in (from_chain, to_chain):
+            estimated_time = 10 * 60  # 10 minutes (Base is fast)
+        else:
+            estimated_time = 15 * 60  # 15 minutes
+        
+        reliability = 0.95  # Circle CCTP is very reliable
+        
+        table[(from_chain, to_chain)] = (base_gas_cost, estimated_time, reliability)
+    return table
+
+
+_ROUTE_TABLE = _build_route_table()
+
+
+@lru_cache(maxsize=512)
+def _compute_route(from_chain: Chain, to_chain: Chain, amount_bucket: int) -> BridgeRoute:
+    """
+    Build the route between two different chains for an amount quantized to cents
+    
+    Routes are pure functions of their inputs and BridgeRoute is frozen, so
+    the cached instances are shared across callers and skill instances.
+    
+    Args:
+        from_chain: Source chain
+        to_chain: Destination chain
+        amount_bucket: Amount in USDC cents (round(amount * 100))
+        
+    Returns:
+        BridgeRoute object with optimal route info
+    """
+    base_gas_cost, estimated_time, reliability = _ROUTE_TABLE[(from_chain, to_chain)]
+    bridge_fee = amount_bucket / 100 * BRIDGE_FEE_RATE
+    
+    return BridgeRoute(
+        from_chain=from_chain,
+        to_chain=to_chain,
+        estimated_time_seconds=estimated_time,
+        estimated_gas_cost_usd=base_gas_cost,
+        bridge_fee_usd=bridge_fee,
+        total_cost_usd=base_gas_cost + bridge_fee,
+        reliability_score=reliability
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class BridgeTransaction:
-    """Represents a bridge transaction"""
+    """
+    Represents a bridge transaction
+    
+    Immutable; the live status is tracked by MultiChainBridgeSkill, keyed by tx_hash.
+    """
     tx_hash: str
     from_chain: Chain
     to_chain: Chain
@@ -69,9 +188,54 @@ class MultiChainBridgeSkill:
     Main skill class for multi-chain USDC bridging
     """
     
-    def __init__(self):
+    __slots__ = (
+        "chains",
+        "bridge_history",
+        "_bridge_by_hash",
+        "_bridge_status",
+        "_balance_cache",
+        "_session",
+        "_sem",
+    )
+    
+    def __init__(self, max_concurrency: int = 8):
+        """
+        Args:
+            max_concurrency: Maximum RPC requests in flight at once (avoids provider rate limits)
+        """
         self.chains = self._initialize_chains()
-        self.bridge_history: List[BridgeTransaction] = []
+        self.bridge_history: Deque[BridgeTransaction] = deque(maxlen=MAX_BRIDGE_HISTORY)
+        self._bridge_by_hash: Dict[str, BridgeTransaction] = {}
+        self._bridge_status: Dict[str, str] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._balance_cache = TTLCache(maxsize=256, ttl=15)
+    
+    async def __aenter__(self) -> "MultiChainBridgeSkill":
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=5)
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the pooled HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
         
     def _initialize_chains(self) -> Dict[Chain, ChainConfig]:
         """Initialize chain configurations"""
@@ -137,47 +301,243 @@ class MultiChainBridgeSkill:
         Returns:
             Dict with balance info
         """
-        config = self.chains[chain]
-        
-        balance = {
-            "address": agent_address,
-            "chain": chain.value,
-            "chain_name": config.name,
-            "usdc_balance": "100.50",
-            "native_balance": "0.05",
-            "usdc_address": config.usdc_address,
-            "timestamp": asyncio.get_event_loop().time()
-        }
-        
-        return balance
+        balances = await self._fetch_balances(agent_address, [chain])
+        return balances[0]
     
     async def check_all_balances(
         self, 
-        agent_address: str
+        agent_address: str,
+        batch_size: int = 10,
+        return_exceptions: bool = True
     ) -> List[Dict[str, any]]:
         """
         Check USDC balance across all supported chains
         
+        Chains served by the same RPC endpoint are queried in one JSON-RPC batch.
+        
         Args:
             agent_address: Ethereum address to check
+            batch_size: Maximum calls per JSON-RPC batch
+            return_exceptions: Report failed chains as {"error": ...} entries instead of
+                raising, so one bad endpoint does not sink the aggregate
             
         Returns:
             List of balance info for each chain
         """
-        tasks = [
-            self.check_balance(agent_address, chain)
-            for chain in Chain
-        ]
-        balances = await asyncio.gather(*tasks)
+        by_chain = {
+            b["chain"]: b
+            async for b in self.stream_balances(agent_address, batch_size, return_exceptions)
+        }
+        balances = [by_chain[CHAIN_VALUES[chain]] for chain in ALL_CHAINS]
         
-        # Calculate total
-        total_usdc = sum(float(b["usdc_balance"]) for b in balances)
+        # Calculate total (chains that failed have no balance to count)
+        amounts = [b["usdc_balance"] for b in balances if "error" not in b]
         
         return {
-            "total_usdc": f"{total_usdc:.2f}",
+            "total_usdc": sum(amounts),
             "balances": balances,
-            "chains_with_balance": len([b for b in balances if float(b["usdc_balance"]) > 0])
+            "chains_with_balance": sum(1 for a in amounts if a > 0.0)
+        }
+    
+    async def stream_balances(
+        self,
+        agent_address: str,
+        batch_size: int = 10,
+        return_exceptions: bool = False
+    ) -> AsyncIterator[Dict[str, any]]:
+        """
+        Yield balances across all supported chains as each RPC endpoint answers
+        
+        Lets callers act on the first chains to respond instead of waiting for
+        the slowest one. Fetches still running when the generator is closed
+        are cancelled (wrap it in contextlib.aclosing() to close it as soon as
+        the caller stops iterating).
+        
+        Args:
+            agent_address: Ethereum address to check
+            batch_size: Maximum calls per JSON-RPC batch
+            return_exceptions: Yield failed chains as {"error": ...} entries instead of raising
+            
+        Yields:
+            Balance info for one chain
+        """
+        chains_by_rpc: Dict[str, List[Chain]] = {}
+        for chain in ALL_CHAINS:
+            chains_by_rpc.setdefault(self.chains[chain].rpc_url, []).append(chain)
+        
+        async def fetch_group(chains: List[Chain]) -> List[Dict[str, any]]:
+            try:
+                return await self._fetch_balances(agent_address, chains, batch_size)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return [
+                    {
+                        "address": agent_address,
+                        "chain": CHAIN_VALUES[chain],
+                        "chain_name": self.chains[chain].name,
+                        "error": str(e)
+                    }
+                    for chain in chains
+                ]
+        
+        tasks = [
+            asyncio.create_task(fetch_group(chains))
+            for chains in chains_by_rpc.values()
+        ]
+        try:
+            for group in asyncio.as_completed(tasks):
+                for balance in await group:
+                    yield balance
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark failures as retrieved so they are not reported as unhandled
+                    task.exception()
+    
+    async def _fetch_balances(
+        self,
+        agent_address: str,
+        chains: List[Chain],
+        batch_size: int = 10
+    ) -> List[Dict[str, any]]:
+        """
+        Fetch USDC and native balances for chains that share one RPC endpoint
+        
+        Args:
+            agent_address: Ethereum address to check
+            chains: Chains to query (all with the same rpc_url)
+            batch_size: Maximum calls per JSON-RPC batch
+            
+        Returns:
+            List of balance info, in the same order as chains
+        """
+        address_key = agent_address.lower()
+        cached = {
+            chain: self._balance_cache.get((address_key, chain))
+            for chain in chains
         }
+        missing = [chain for chain in chains if cached[chain] is None]
+        if not missing:
+            # Hand out copies so callers cannot mutate the cached dicts
+            return [dict(cached[chain]) for chain in chains]
+        
+        address_hex = _address_hex(agent_address)
+        balance_of_data = BALANCE_OF_SELECTOR + address_hex.rjust(64, "0")
+        
+        calls = []
+        for chain in missing:
+            config = self.chains[chain]
+            calls.append(("eth_call", [{"to": config.usdc_address, "data": balance_of_data}, "latest"]))
+            calls.append(("eth_getBalance", ["0x" + address_hex, "latest"]))
+        
+        results = await self._batch_balance_call(self.chains[missing[0]].rpc_url, calls, batch_size)
+        now = asyncio.get_running_loop().time()
+        
+        for i, chain in enumerate(missing):
+            config = self.chains[chain]
+            usdc_raw, native_raw = results[2 * i], results[2 * i + 1]
+            balance = {
+                "address": agent_address,
+                "chain": CHAIN_VALUES[chain],
+                "chain_name": config.name,
+                "usdc_balance": _hex_to_int(usdc_raw) / 10 ** USDC_DECIMALS,
+                "native_balance": _hex_to_int(native_raw) / 10 ** NATIVE_DECIMALS,
+                "usdc_address": config.usdc_address,
+                "timestamp": now
+            }
+            self._balance_cache[(address_key, chain)] = balance
+            cached[chain] = balance
+        
+        return [dict(cached[chain]) for chain in chains]
+    
+    async def _batch_balance_call(
+        self,
+        rpc_url: str,
+        calls: List[Tuple[str, list]],
+        batch_size: int = 10
+    ) -> List:
+        """
+        Send JSON-RPC calls to one endpoint as batch requests
+        
+        Args:
+            rpc_url: JSON-RPC endpoint
+            calls: (method, params) pairs
+            batch_size: Maximum calls per batch (providers cap batch size)
+            
+        Returns:
+            Results in the same order as calls
+        """
+        requests = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        batches = [
+            requests[i:i + batch_size]
+            for i in range(0, len(requests), batch_size)
+        ]
+        
+        session = self._get_session()
+        responses = await asyncio.gather(*(
+            self._post_batch(session, rpc_url, batch)
+            for batch in batches
+        ))
+        
+        by_id = {r.get("id"): r for batch in responses for r in batch}
+        results = []
+        for request in requests:
+            response = by_id.get(request["id"])
+            if response is None or "error" in response:
+                error = response.get("error") if response else "no response"
+                raise RuntimeError(f"{request['method']} failed on {rpc_url}: {error}")
+            results.append(response["result"])
+        
+        return results
+    
+    async def _post_batch(
+        self,
+        session: aiohttp.ClientSession,
+        rpc_url: str,
+        batch: List[Dict]
+    ) -> List[Dict]:
+        """
+        POST one JSON-RPC batch, falling back to single requests if the provider rejects it
+        
+        Raises:
+            aiohttp.ClientResponseError: On rate limiting (429), server errors and
+                other HTTP failures; retrying those as single requests would only add load
+        """
+        async with self._sem:
+            async with session.post(rpc_url, json=batch) as response:
+                if response.status in _BATCH_REJECTED_STATUSES:
+                    data = None
+                else:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+        
+        if isinstance(data, list):
+            return data
+        
+        # Provider does not accept batches (HTTP rejection or a single JSON-RPC
+        # error object instead of a list): send the calls individually, in parallel
+        return await asyncio.gather(*(
+            self._post_rpc(session, rpc_url, request)
+            for request in batch
+        ))
+    
+    async def _post_rpc(
+        self,
+        session: aiohttp.ClientSession,
+        rpc_url: str,
+        request: Dict
+    ) -> Dict:
+        """POST a single JSON-RPC request"""
+        async with self._sem:
+            async with session.post(rpc_url, json=request) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
     
     def find_optimal_route(
         self,
@@ -202,32 +562,10 @@ class MultiChainBridgeSkill:
         Returns:
             BridgeRoute object with optimal route info
         """
-        # Calculate estimated costs
-        base_gas_cost = 0.50  # ~$0.50 in ETH for transaction
-        bridge_fee = amount * 0.001  # 0.1% bridge fee
-        
-        # Estimate time based on chains
-        if from_chain == Chain.BASE_SEPOLIA or to_chain == Chain.BASE_SEPOLIA:
-            estimated_time = 10 * 60  # 10 minutes (Base is fast)
-        else:
-            estimated_time = 15 * 60  # 15 minutes
-        
-        # Calculate reliability score
-        reliability = 0.95  # Circle CCTP is very reliable
-        
-        total_cost = base_gas_cost + bridge_fee
-        
-        route = BridgeRoute(
-            from_chain=from_chain,
-            to_chain=to_chain,
-            estimated_time_seconds=estimated_time,
-            estimated_gas_cost_usd=base_gas_cost,
-            bridge_fee_usd=bridge_fee,
-            total_cost_usd=total_cost,
-            reliability_score=reliability
-        )
+        if from_chain == to_chain:
+            return _SAME_CHAIN_ROUTES[from_chain]
         
-        return route
+        return _compute_route(from_chain, to_chain, round(amount * 100))
     
     def compare_routes(
         self,
@@ -246,16 +584,20 @@ class MultiChainBridgeSkill:
         Returns:
             List of routes sorted by total cost (cheapest first)
         """
-        routes = [
-            self.find_optimal_route(from_chain, to_chain, amount)
+        # The bridge fee depends only on the amount, so ranking by gas cost
+        # gives the same order as ranking by total cost
+        costs = [
+            (_ROUTE_TABLE[(from_chain, to_chain)][0], to_chain)
             for to_chain in target_chains
             if to_chain != from_chain
         ]
+        if len(costs) > 1:
+            costs.sort(key=itemgetter(0))
         
-        # Sort by total cost
-        routes.sort(key=lambda r: r.total_cost_usd)
-        
-        return routes
+        return [
+            self.find_optimal_route(from_chain, to_chain, amount)
+            for _, to_chain in costs
+        ]
     
     async def bridge_usdc(
         self,
@@ -277,7 +619,13 @@ class MultiChainBridgeSkill:
             
         Returns:
             BridgeTransaction object
+            
+        Raises:
+            ValueError: If from_chain and to_chain are the same (nothing to bridge)
         """
+        if from_chain == to_chain:
+            raise ValueError(f"Nothing to bridge: source and destination are both {from_chain.value}")
+        
         # Get route info
         route = self.find_optimal_route(from_chain, to_chain, amount)
         
@@ -289,7 +637,7 @@ class MultiChainBridgeSkill:
         
         # For demo, simulate the transaction
         tx_hash = self._generate_mock_tx_hash(from_chain, to_chain, amount)
-        current_time = int(asyncio.get_event_loop().time())
+        current_time = int(asyncio.get_running_loop().time())
         
         transaction = BridgeTransaction(
             tx_hash=tx_hash,
@@ -301,7 +649,18 @@ class MultiChainBridgeSkill:
             estimated_arrival=current_time + route.estimated_time_seconds
         )
         
+        if len(self.bridge_history) == self.bridge_history.maxlen:
+            # The oldest transaction is about to be evicted: drop it from the index too
+            evicted_hash = self.bridge_history[0].tx_hash
+            self._bridge_by_hash.pop(evicted_hash, None)
+            self._bridge_status.pop(evicted_hash, None)
         self.bridge_history.append(transaction)
+        self._bridge_by_hash[tx_hash] = transaction
+        self._bridge_status[tx_hash] = transaction.status
+        
+        # Funds left the source chain: its cached balances are stale
+        for key in [k for k in self._balance_cache if k[1] == from_chain]:
+            del self._balance_cache[key]
         
         return transaction
     
@@ -311,9 +670,8 @@ class MultiChainBridgeSkill:
         to_chain: Chain,
         amount: float
     ) -> str:
-        """Generate a mock transaction hash for demo"""
-        data = f"{from_chain.value}-{to_chain.value}-{amount}-{asyncio.get_event_loop().time()}"
-        return "0x" + hashlib.sha256(data.encode()).hexdigest()[:64]
+        """Generate a mock transaction hash for demo (random, nothing to hash)"""
+        return "0x" + secrets.token_hex(32)
     
     async def track_bridge_status(
         self,
@@ -329,7 +687,7 @@ class MultiChainBridgeSkill:
             Dict with status info
         """
         # Find transaction in history
-        tx = next((t for t in self.bridge_history if t.tx_hash == tx_hash), None)
+        tx = self._bridge_by_hash.get(tx_hash)
         
         if not tx:
             return {
@@ -337,27 +695,24 @@ class MultiChainBridgeSkill:
                 "tx_hash": tx_hash
             }
         
-        current_time = int(asyncio.get_event_loop().time())
+        current_time = int(asyncio.get_running_loop().time())
         
-        if current_time >= tx.estimated_arrival:
-            status = "completed"
-            progress = 100
-        else:
-            elapsed = current_time - tx.timestamp
-            total_time = tx.estimated_arrival - tx.timestamp
-            progress = int((elapsed / total_time) * 100)
-            status = "in_progress"
+        remaining = tx.estimated_arrival - current_time
+        total_time = (tx.estimated_arrival - tx.timestamp) or 1
+        progress = min(100, int(100 * (1 - remaining / total_time)))
+        status = "completed" if remaining <= 0 else "in_progress"
+        self._bridge_status[tx_hash] = status
         
         return {
             "tx_hash": tx_hash,
             "status": status,
             "progress": progress,
-            "from_chain": tx.from_chain.value,
-            "to_chain": tx.to_chain.value,
+            "from_chain": CHAIN_VALUES[tx.from_chain],
+            "to_chain": CHAIN_VALUES[tx.to_chain],
             "amount": tx.amount,
             "timestamp": tx.timestamp,
             "estimated_arrival": tx.estimated_arrival,
-            "time_remaining_seconds": max(0, tx.estimated_arrival - current_time)
+            "time_remaining_seconds": remaining if remaining > 0 else 0
         }
     
     def get_bridge_history(
@@ -373,18 +728,30 @@ class MultiChainBridgeSkill:
         Returns:
             List of transaction info
         """
-        recent = self.bridge_history[-limit:]
-        return [
-            {
+        return list(self.iter_bridge_history(limit))
+    
+    def iter_bridge_history(
+        self,
+        limit: int = 10
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Lazily iterate recent bridge history, newest first
+        
+        Args:
+            limit: Maximum number of transactions to yield
+            
+        Yields:
+            Transaction info
+        """
+        for tx in islice(reversed(self.bridge_history), limit):
+            yield {
                 "tx_hash": tx.tx_hash,
-                "from_chain": tx.from_chain.value,
-                "to_chain": tx.to_chain.value,
+                "from_chain": CHAIN_VALUES[tx.from_chain],
+                "to_chain": CHAIN_VALUES[tx.to_chain],
                 "amount": tx.amount,
-                "status": tx.status,
+                "status": self._bridge_status.get(tx.tx_hash, tx.status),
                 "timestamp": tx.timestamp
             }
-            for tx in reversed(recent)
-        ]
     
     def estimate_total_cost(
         self,
@@ -420,10 +787,10 @@ class MultiChainBridgeSkill:
             base_fee_percent = 1.0  # 1%
             
             # Apply reputation discount
-            if worker_reputation >= 800:
-                base_fee_percent *= 0.9  # 10% off
-            elif worker_reputation >= 500:
-                base_fee_percent *= 0.95  # 5% off
+            base_fee_percent *= next(
+                (multiplier for threshold, multiplier in _REP_TIERS if worker_reputation >= threshold),
+                1.0
+            )
             
             escrow_fee = amount * (base_fee_percent / 100)
             costs["escrow_fee"] = escrow_fee
@@ -443,69 +810,71 @@ async def main():
     print("🦞 AgentPay Protocol - Multi-Chain Bridge Skill")
     print("=" * 60)
     
-    skill = MultiChainBridgeSkill()
-    
-    # Test address
-    test_address = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
-    
-    # 1. Check balances
-    print("\n📊 Checking balances across all chains...")
-    balances = await skill.check_all_balances(test_address)
-    print(f"Total USDC: ${balances['total_usdc']}")
-    for balance in balances['balances']:
-        print(f"  {balance['chain_name']}: {balance['usdc_balance']} USDC")
-    
-    # 2. Find optimal route
-    print("\n🔍 Finding optimal bridge route...")
-    route = skill.find_optimal_route(
-        Chain.ARBITRUM_SEPOLIA,
-        Chain.BASE_SEPOLIA,
-        100.0
-    )
-    print(f"Route: {route.from_chain.value} → {route.to_chain.value}")
-    print(f"Estimated time: {route.estimated_time_seconds // 60} minutes")
-    print(f"Total cost: ${route.total_cost_usd:.4f}")
-    print(f"Reliability: {route.reliability_score * 100}%")
-    
-    # 3. Compare multiple routes
-    print("\n📈 Comparing routes to different chains...")
-    routes = skill.compare_routes(
-        Chain.ARBITRUM_SEPOLIA,
-        100.0,
-        [Chain.BASE_SEPOLIA, Chain.OPTIMISM_SEPOLIA, Chain.POLYGON_AMOY]
-    )
-    for i, r in enumerate(routes, 1):
-        print(f"{i}. {r.to_chain.value} - ${r.total_cost_usd:.4f} ({r.estimated_time_seconds // 60}min)")
-    
-    # 4. Execute bridge (demo)
-    print("\n🌉 Executing bridge transaction...")
-    tx = await skill.bridge_usdc(
-        Chain.ARBITRUM_SEPOLIA,
-        Chain.BASE_SEPOLIA,
-        100.0,
-        test_address
-    )
-    print(f"Transaction hash: {tx.tx_hash}")
-    print(f"Status: {tx.status}")
-    print(f"ETA: {tx.estimated_arrival - tx.timestamp} seconds")
-    
-    # 5. Track status
-    print("\n🔎 Tracking transaction status...")
-    status = await skill.track_bridge_status(tx.tx_hash)
-    print(f"Progress: {status['progress']}%")
-    print(f"Status: {status['status']}")
-    
-    # 6. Estimate costs
-    print("\n💰 Estimating total costs with escrow...")
-    costs = skill.estimate_total_cost(
-        Chain.ARBITRUM_SEPOLIA,
-        Chain.BASE_SEPOLIA,
-        1000.0,
-        include_escrow_fee=True,
-        worker_reputation=850
-    )
-    for key, value in costs.items():
-        print(f"  {key}: ${value:.4f}")
+    async with MultiChainBridgeSkill() as skill:
+        # Test address
+        test_address = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+        
+        # 1. Check balances
+        print("\n📊 Checking balances across all chains...")
+        balances = await skill.check_all_balances(test_address)
+        print(f"Total USDC: ${balances['total_usdc']:.2f}")
+        for balance in balances['balances']:
+            if "error" in balance:
+                print(f"  {balance['chain_name']}: unavailable ({balance['error']})")
+            else:
+                print(f"  {balance['chain_name']}: {balance['usdc_balance']:.2f} USDC")
+        
+        # 2. Find optimal route
+        print("\n🔍 Finding optimal bridge route...")
+        route = skill.find_optimal_route(
+            Chain.ARBITRUM_SEPOLIA,
+            Chain.BASE_SEPOLIA,
+            100.0
+        )
+        print(f"Route: {route.from_chain.value} → {route.to_chain.value}")
+        print(f"Estimated time: {route.estimated_time_seconds // 60} minutes")
+        print(f"Total cost: ${route.total_cost_usd:.4f}")
+        print(f"Reliability: {route.reliability_score * 100}%")
+        
+        # 3. Compare multiple routes
+        print("\n📈 Comparing routes to different chains...")
+        routes = skill.compare_routes(
+            Chain.ARBITRUM_SEPOLIA,
+            100.0,
+            [Chain.BASE_SEPOLIA, Chain.OPTIMISM_SEPOLIA, Chain.POLYGON_AMOY]
+        )
+        for i, r in enumerate(routes, 1):
+            print(f"{i}. {r.to_chain.value} - ${r.total_cost_usd:.4f} ({r.estimated_time_seconds // 60}min)")
+        
+        # 4. Execute bridge (demo)
+        print("\n🌉 Executing bridge transaction...")
+        tx = await skill.bridge_usdc(
+            Chain.ARBITRUM_SEPOLIA,
+            Chain.BASE_SEPOLIA,
+            100.0,
+            test_address
+        )
+        print(f"Transaction hash: {tx.tx_hash}")
+        print(f"Status: {tx.status}")
+        print(f"ETA: {tx.estimated_arrival - tx.timestamp} seconds")
+        
+        # 5. Track status
+        print("\n🔎 Tracking transaction status...")
+        status = await skill.track_bridge_status(tx.tx_hash)
+        print(f"Progress: {status['progress']}%")
+        print(f"Status: {status['status']}")
+        
+        # 6. Estimate costs
+        print("\n💰 Estimating total costs with escrow...")
+        costs = skill.estimate_total_cost(
+            Chain.ARBITRUM_SEPOLIA,
+            Chain.BASE_SEPOLIA,
+            1000.0,
+            include_escrow_fee=True,
+            worker_reputation=850
+        )
+        for key, value in costs.items():
+            print(f"  {key}: ${value:.4f}")
     
     print("\n" + "=" * 60)
     print("✅ Demo complete!")
@@ -0,0 +1,22 @@
+"""
+Build the optional AOT-compiled fee module (_fast.pyx)
+
+Usage:
+    pip install cython
+    python setup_fast.py build_ext --inplace
+
+agentpay_client picks up the compiled module automatically and falls back
+to numba or plain Python when it is not built.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="agentpay-fast",
+    ext_modules=cythonize(
+        "_fast.pyx",
+        language_level=3,
+        compiler_directives={"boundscheck": False, "cdivision": True}
+    )
+)
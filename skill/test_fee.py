@@ -0,0 +1,28 @@
+"""
+Fee calculation: the scalar kernel must agree with calculate_fee_batch
+
+Run with: python -m pytest skill/test_fee.py
+"""
+
+import pytest
+
+from agentpay_client import _calc_fee_impl, calculate_fee_batch
+
+
+# Just below and exactly on each volume-discount boundary, plus ordinary amounts
+AMOUNTS = [0.5, 1.0, 123.45, 999.996, 1000.0, 9999.999, 10000.0, 49999.999, 50000.0, 75000.0]
+
+
+@pytest.mark.parametrize("is_cross_chain", [False, True])
+@pytest.mark.parametrize("reputation", [0, 499, 500, 799, 800, 1000])
+@pytest.mark.parametrize("complexity", [0, 1, 2])
+@pytest.mark.parametrize("amount", AMOUNTS)
+def test_scalar_fee_matches_batch(amount, complexity, reputation, is_cross_chain):
+    expected = calculate_fee_batch([amount], [complexity], [reputation], [is_cross_chain])[0]
+    fee = _calc_fee_impl(amount, complexity, reputation, is_cross_chain)
+    assert fee == pytest.approx(expected, rel=1e-12)
+
+
+def test_amount_below_boundary_keeps_its_tier():
+    # 999.996 must not be priced in the >= 1000 volume tier
+    assert _calc_fee_impl(999.996, 1, 0, False) == pytest.approx(9.99996)